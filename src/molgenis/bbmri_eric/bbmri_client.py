@@ -4,6 +4,9 @@ from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import List
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from molgenis.bbmri_eric.model import (
     EricData,
     ExternalServerNode,
@@ -52,6 +55,20 @@ class ImportMetadataAction(Enum):
     IGNORE = "ignore"
 
 
+def _mount_http_adapter(session: Session):
+    """
+    Mounts a pooled HTTP adapter that retries failed connections on the underlying
+    requests.Session, so that all requests to a server reuse the same connections.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session._session.mount("https://", adapter)
+    session._session.mount("http://", adapter)
+
+
 class EricSession(Session):
     """
     A session with a BBMRI ERIC directory. Contains methods to get national nodes,
@@ -60,6 +77,7 @@ class EricSession(Session):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        _mount_http_adapter(self)
 
     NODES_TABLE = "eu_bbmri_eric_national_nodes"
 
@@ -79,13 +97,14 @@ class EricSession(Session):
         """
         matching_attrs = matching_attrs if matching_attrs else []
 
+        meta = TableMeta(meta=self.get_meta(entity_type_id))
         rows = self.get(
             entity_type_id,
             batch_size=10000,
             attributes=f"id,{parent_attr},ontology,{','.join(matching_attrs)}",
+            sort_column=meta.id_attribute,
             uploadable=True,
         )
-        meta = TableMeta(meta=self.get_meta(entity_type_id))
         return OntologyTable.of(meta, rows, parent_attr, matching_attrs)
 
     def get_quality_info(self) -> QualityInfo:
@@ -179,11 +198,14 @@ class EricSession(Session):
 
     @staticmethod
     def _validate_codes(codes: List[str], nodes: List[dict]):
-        """Raises a KeyError if a requested node code was not found."""
+        """Raises a KeyError listing all requested node codes that were not found."""
         retrieved_codes = {node["id"] for node in nodes}
-        for code in codes:
-            if code not in retrieved_codes:
-                raise KeyError(f"Unknown code: {code}")
+        unknown_codes = [code for code in codes if code not in retrieved_codes]
+        if unknown_codes:
+            raise KeyError(
+                f"Unknown code{'s' if len(unknown_codes) > 1 else ''}: "
+                f"{', '.join(unknown_codes)}"
+            )
 
     @staticmethod
     def _to_nodes(nodes: List[dict]):
@@ -225,7 +247,12 @@ class EricSession(Session):
             tables[table_type.value] = Table.of(
                 table_type=table_type,
                 meta=meta,
-                rows=self.get(id_, batch_size=10000, uploadable=True),
+                rows=self.get(
+                    id_,
+                    batch_size=10000,
+                    sort_column=meta.id_attribute,
+                    uploadable=True,
+                ),
             )
 
         return NodeData.from_dict(node=node, source=Source.STAGING, tables=tables)
@@ -250,6 +277,7 @@ class EricSession(Session):
                 rows=self.get(
                     id_,
                     batch_size=10000,
+                    sort_column=meta.id_attribute,
                     q=f"national_node=={node.code}",
                     uploadable=True,
                 ),
@@ -286,6 +314,7 @@ class EricSession(Session):
                 rows=self.get(
                     id_,
                     batch_size=10000,
+                    sort_column=meta.id_attribute,
                     q=f"national_node=in=({','.join(codes)})",
                     attributes=",".join(attrs),
                     uploadable=True,
@@ -319,6 +348,7 @@ class ExternalServerSession(Session):
 
     def __init__(self, node: ExternalServerNode):
         super().__init__(url=node.url, token=node.token)
+        _mount_http_adapter(self)
         self.node = node
 
     def get_node_data(self) -> NodeData:
@@ -338,7 +368,12 @@ class ExternalServerSession(Session):
                 tables[table_type.value] = Table.of(
                     table_type=table_type,
                     meta=meta,
-                    rows=self.get(id_, batch_size=10000, uploadable=True),
+                    rows=self.get(
+                        id_,
+                        batch_size=10000,
+                        sort_column=meta.id_attribute,
+                        uploadable=True,
+                    ),
                 )
 
         return NodeData.from_dict(
@@ -42,6 +42,10 @@ class Eric:
         Parameters:
             nodes (List[ExternalServerNode]): The list of external nodes to stage
         """
+        for node in nodes:
+            if not isinstance(node, ExternalServerNode):
+                raise ValueError(f"Node {node.code} has no external server to stage")
+
         report = ErrorReport(nodes)
         for node in nodes:
             self.printer.print_node_title(node)
@@ -64,6 +68,8 @@ class Eric:
         """
         if not self.pid_service:
             raise ValueError("A PID service is required to publish nodes")
+        if not nodes:
+            raise ValueError("No nodes provided")
 
         report = ErrorReport(nodes)
         try:
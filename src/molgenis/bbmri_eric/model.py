@@ -4,7 +4,7 @@ from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 from molgenis.bbmri_eric.utils import to_ordered_dict
 
@@ -33,7 +33,7 @@ class TableMeta:
     """Convenient wrapper for the output of the metadata API."""
 
     meta: dict
-    id_attribute: str = field(init=False)
+    id_attribute: Optional[str] = field(init=False, default=None)
 
     def __post_init__(self):
         for attribute in self.meta["attributes"]["items"]:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from molgenis.bbmri_eric.errors import EricWarning
 from molgenis.bbmri_eric.model import Table
@@ -38,16 +38,12 @@ class PidManager(BasePidManager):
         Make sure to enrich the table with existing PIDs before using this method.
         """
         warnings = []
-        for biobank in biobanks.rows:
+        for biobank in biobanks.rows_by_id.values():
             if "pid" not in biobank:
+                status = Status.WITHDRAWN if biobank.get("withdrawn", False) else None
                 biobank["pid"] = self._register_biobank_pid(
-                    biobank["id"], biobank["name"], warnings
+                    biobank["id"], biobank["name"], status, warnings
                 )
-                if biobank.get("withdrawn", False):
-                    self.pid_service.set_status(biobank["pid"], Status.WITHDRAWN)
-                    self.printer.print(
-                        f"Set STATUS of {biobank['pid']} to {Status.WITHDRAWN.value}"
-                    )
 
         return warnings
 
@@ -56,15 +52,12 @@ class PidManager(BasePidManager):
         Detects changes in biobanks and updates their PIDs accordingly.
         """
         existing_biobanks = existing_biobanks.rows_by_id
-        for biobank in biobanks.rows:
-            id_ = biobank["id"]
-            if id_ in existing_biobanks:
-                if biobank["name"] != existing_biobanks.get(biobank["id"])["name"]:
+        for biobank in biobanks.rows_by_id.values():
+            existing_biobank = existing_biobanks.get(biobank["id"])
+            if existing_biobank:
+                if biobank["name"] != existing_biobank["name"]:
                     self._update_biobank_name(biobank["pid"], biobank["name"])
-                if (
-                    biobank.get("withdrawn", False)
-                    != existing_biobanks.get(biobank["id"])["withdrawn"]
-                ):
+                if biobank.get("withdrawn", False) != existing_biobank["withdrawn"]:
                     self._update_withdrawn_status(biobank["pid"], biobank["withdrawn"])
 
     def terminate_biobanks(self, biobank_pids: List[str]):
@@ -78,11 +71,16 @@ class PidManager(BasePidManager):
             )
 
     def _register_biobank_pid(
-        self, biobank_id: str, biobank_name: str, warnings: List[EricWarning]
+        self,
+        biobank_id: str,
+        biobank_name: str,
+        status: Optional[Status],
+        warnings: List[EricWarning],
     ) -> str:
         """
         Registers a PID for a new biobank. If one or more PIDs for this biobank already
-        exist, warnings will be shown.
+        exist, warnings will be shown. A new PID is registered with its STATUS in the
+        same request, an existing PID gets its STATUS set afterwards.
         """
         url = self.biobank_url_prefix + biobank_id
         existing_pids = self.pid_service.reverse_lookup(url)
@@ -95,10 +93,17 @@ class PidManager(BasePidManager):
             )
             self.printer.print_warning(warning)
             warnings.append(warning)
+            if status:
+                self.pid_service.set_status(pid, status)
         else:
-            pid = self.pid_service.register_pid(url=url, name=biobank_name)
+            pid = self.pid_service.register_pid(
+                url=url, name=biobank_name, status=status
+            )
             self.printer.print(f'Registered {pid} for new biobank "{biobank_name}"')
 
+        if status:
+            self.printer.print(f"Set STATUS of {pid} to {status.value}")
+
         return pid
 
     def _update_biobank_name(self, pid: str, name: str):
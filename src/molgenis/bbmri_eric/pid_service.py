@@ -50,7 +50,7 @@ class BasePidService(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def register_pid(self, url: str, name: str) -> str:
+    def register_pid(self, url: str, name: str, status: Optional[Status] = None) -> str:
         pass
 
     @abstractmethod
@@ -140,16 +140,21 @@ class PidService(BasePidService):
         return pids
 
     @pyhandle_error_handler
-    def register_pid(self, url: str, name: str) -> str:
+    def register_pid(self, url: str, name: str, status: Optional[Status] = None) -> str:
         """
-        Generates a new PID and registers it with a URL and a NAME field.
+        Generates a new PID and registers it with a URL and a NAME field. If a status
+        is provided, the STATUS field is registered in the same request.
 
         :param url: the URL for the handle
         :param name: the NAME for the handle
+        :param status: an optional Status enum for the STATUS field
         :return: the generated PID
         """
         pid = self.generate_pid(self.prefix)
-        return self.client.register_handle(handle=pid, location=url, NAME=name)
+        fields = {"NAME": name}
+        if status:
+            fields["STATUS"] = status.value
+        return self.client.register_handle(handle=pid, location=url, **fields)
 
     @pyhandle_error_handler
     def set_name(self, pid: str, new_name: str):
@@ -193,7 +198,7 @@ class DummyPidService(BasePidService):
     def reverse_lookup(self, url: str) -> Optional[List[str]]:
         pass
 
-    def register_pid(self, url: str, name: str) -> str:
+    def register_pid(self, url: str, name: str, status: Optional[Status] = None) -> str:
         return self.generate_pid("FAKE-PREFIX")
 
     def set_name(self, pid: str, new_name: str):
@@ -215,7 +220,7 @@ class NoOpPidService(BasePidService):
     def reverse_lookup(self, url: str) -> Optional[List[str]]:
         pass
 
-    def register_pid(self, url: str, name: str) -> str:
+    def register_pid(self, url: str, name: str, status: Optional[Status] = None) -> str:
         pass
 
     def set_name(self, pid: str, new_name: str):
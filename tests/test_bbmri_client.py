@@ -0,0 +1,109 @@
+from unittest.mock import MagicMock, call
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from molgenis.bbmri_eric.bbmri_client import (
+    AttributesRequest,
+    EricSession,
+    ExternalServerSession,
+)
+from molgenis.bbmri_eric.model import ExternalServerNode, Node, TableType
+
+
+def test_validate_codes():
+    EricSession._validate_codes(["NL", "BE"], [{"id": "NL"}, {"id": "BE"}])
+
+
+def test_validate_codes_unknown_code():
+    with pytest.raises(KeyError) as e:
+        EricSession._validate_codes(["NL", "XX"], [{"id": "NL"}])
+
+    assert e.value.args[0] == "Unknown code: XX"
+
+
+def test_validate_codes_unknown_codes():
+    with pytest.raises(KeyError) as e:
+        EricSession._validate_codes(["XX", "NL", "YY"], [{"id": "NL"}])
+
+    assert e.value.args[0] == "Unknown codes: XX, YY"
+
+
+@pytest.mark.parametrize(
+    "session",
+    [
+        EricSession(url="https://directory.test/"),
+        ExternalServerSession(
+            ExternalServerNode("NL", "Netherlands", None, "https://nl.test/")
+        ),
+    ],
+)
+def test_http_adapter_mounted(session):
+    adapter = session._session.get_adapter("https://directory.test/api/")
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.max_retries.total == 3
+
+
+def _mock_meta(id_: str) -> dict:
+    return {
+        "id": id_,
+        "attributes": {
+            "items": [
+                {"data": {"name": "name", "idAttribute": False}},
+                {"data": {"name": "code", "idAttribute": True}},
+            ]
+        },
+    }
+
+
+@pytest.fixture
+def eric_session() -> EricSession:
+    session = EricSession(url="https://directory.test/")
+    session.get = MagicMock(return_value=[])
+    session.get_meta = MagicMock(side_effect=_mock_meta)
+    return session
+
+
+def test_get_staging_node_data_sort_column(eric_session):
+    eric_session.get_staging_node_data(Node("NL"))
+
+    assert eric_session.get.mock_calls == [
+        call(
+            Node("NL").get_staging_id(table_type),
+            batch_size=10000,
+            sort_column="code",
+            uploadable=True,
+        )
+        for table_type in TableType.get_import_order()
+    ]
+
+
+def test_get_published_data_sort_column(eric_session):
+    eric_session.get_published_data(
+        [Node("NL"), Node("BE")],
+        AttributesRequest(
+            persons=["id"],
+            networks=["id"],
+            also_known_in=["id"],
+            biobanks=["id", "pid"],
+            collections=["id"],
+            facts=["id"],
+        ),
+    )
+
+    biobanks_call = next(
+        get_call
+        for get_call in eric_session.get.mock_calls
+        if get_call.args[0] == "eu_bbmri_eric_biobanks"
+    )
+    assert biobanks_call == call(
+        "eu_bbmri_eric_biobanks",
+        batch_size=10000,
+        sort_column="code",
+        q="national_node=in=(NL,BE)",
+        attributes="id,pid",
+        uploadable=True,
+    )
+    for get_call in eric_session.get.mock_calls:
+        assert get_call.kwargs["sort_column"] == "code"
@@ -41,6 +41,27 @@ def test_stage_external_nodes(eric):
     eric.printer.print_summary.assert_called_once_with(report)
 
 
+def test_stage_external_nodes_without_external_server(eric):
+    nl = ExternalServerNode("NL", "external", None, "url.nl")
+    no = Node("NO", "not external", None)
+
+    with pytest.raises(ValueError) as e:
+        eric.stage_external_nodes([nl, no])
+
+    assert str(e.value) == "Node NO has no external server to stage"
+    assert not eric.stager.stage.called
+    assert not eric.printer.print_node_title.called
+
+
+def test_publish_nodes_without_nodes(eric, session):
+    with pytest.raises(ValueError) as e:
+        eric.publish_nodes([])
+
+    assert str(e.value) == "No nodes provided"
+    assert not session.get_published_data.called
+    assert not eric.printer.print_header.called
+
+
 def test_publish_node_staging_fails(eric, session, report_init):
     nl = ExternalServerNode("NL", "Netherlands", None, "url")
     state = _setup_state([nl], eric, report_init)
@@ -7,6 +7,7 @@ from molgenis.bbmri_eric.model import (
     NodeData,
     Source,
     Table,
+    TableMeta,
     TableType,
 )
 
@@ -43,6 +44,33 @@ def test_table_factory_method():
     assert table.rows[1] == row2
 
 
+def test_table_meta_id_attribute():
+    meta = TableMeta(
+        meta={
+            "id": "table",
+            "attributes": {
+                "items": [
+                    {"data": {"name": "name", "idAttribute": False}},
+                    {"data": {"name": "id", "idAttribute": True}},
+                ]
+            },
+        }
+    )
+
+    assert meta.id_attribute == "id"
+
+
+def test_table_meta_without_id_attribute():
+    meta = TableMeta(
+        meta={
+            "id": "table",
+            "attributes": {"items": [{"data": {"name": "name", "idAttribute": False}}]},
+        }
+    )
+
+    assert meta.id_attribute is None
+
+
 def test_node_staging_id():
     node = Node("NL", "NL", None)
 
@@ -1,8 +1,8 @@
-from unittest import mock
 from unittest.mock import MagicMock, call
 
 import pytest
 
+from molgenis.bbmri_eric.errors import EricError
 from molgenis.bbmri_eric.model import Table, TableType
 from molgenis.bbmri_eric.pid_manager import (
     NoOpPidManager,
@@ -18,7 +18,7 @@ def pid_manager(pid_service, printer):
     return PidManager(pid_service, printer)
 
 
-def test_assign_biobank_pids(pid_manager, pid_service):
+def test_assign_biobank_pids(pid_manager, pid_service, printer):
     biobanks = Table.of(
         table_type=TableType.BIOBANKS,
         meta=MagicMock(),
@@ -27,29 +27,48 @@ def test_assign_biobank_pids(pid_manager, pid_service):
             {"id": "b2", "name": "biobank2"},
             {"id": "b3", "name": "biobank3"},
             {"id": "b4", "name": "biobank4", "withdrawn": True},
+            {"id": "b5", "name": "biobank5", "withdrawn": True},
         ],
     )
 
-    pid_service.reverse_lookup.side_effect = [[], ["pid3"], []]
-    pid_service.register_pid.return_value = None
+    pid_service.reverse_lookup.side_effect = [[], ["pid3"], [], ["pid5"]]
+    pid_service.register_pid.side_effect = ["pid2", "pid4"]
 
     warnings = pid_manager.assign_biobank_pids(biobanks)
 
-    pid_service.register_pid.assert_has_calls(
-        [
-            call(url="url/#/biobank/b2", name="biobank2"),
-            call(url="url/#/biobank/b4", name="biobank4"),
-        ]
-    )
+    assert pid_service.register_pid.mock_calls == [
+        call(url="url/#/biobank/b2", name="biobank2", status=None),
+        call(url="url/#/biobank/b4", name="biobank4", status=Status.WITHDRAWN),
+    ]
 
-    pid_service.set_status.assert_called_with(None, Status.WITHDRAWN)
+    pid_service.set_status.assert_called_once_with("pid5", Status.WITHDRAWN)
 
-    assert len(warnings) == 1
+    assert len(warnings) == 2
     assert (
         warnings[0].message
         == "PID(s) already exist for new biobank \"biobank3\": ['pid3']. Please check "
         "the PID's contents!"
     )
+    assert (
+        warnings[1].message
+        == "PID(s) already exist for new biobank \"biobank5\": ['pid5']. Please check "
+        "the PID's contents!"
+    )
+
+    assert [row["pid"] for row in biobanks.rows] == [
+        "pid1",
+        "pid2",
+        "pid3",
+        "pid4",
+        "pid5",
+    ]
+    assert printer.print.mock_calls == [
+        call('Registered pid2 for new biobank "biobank2"'),
+        call('Registered pid4 for new biobank "biobank4"'),
+        call("Set STATUS of pid4 to Withdrawn from the BBMRI-ERIC Directory"),
+        call("Set STATUS of pid5 to Withdrawn from the BBMRI-ERIC Directory"),
+    ]
+    assert printer.print_warning.mock_calls == [call(warnings[0]), call(warnings[1])]
 
 
 def test_update_biobank_pids(pid_manager, pid_service):
@@ -82,12 +101,17 @@ def test_update_biobank_pids(pid_manager, pid_service):
     pid_service.remove_status.assert_called_with("pid4")
 
 
-def test_terminate_biobanks(pid_manager, pid_service):
-    pid_manager.terminate_biobanks(["pid1", "pid2"])
+def test_terminate_biobanks(pid_manager, pid_service, printer):
+    pid_service.set_status.side_effect = [None, EricError("error")]
+
+    with pytest.raises(EricError):
+        pid_manager.terminate_biobanks(["pid1", "pid2", "pid3"])
+
     assert pid_service.set_status.mock_calls == [
-        mock.call("pid1", Status.TERMINATED),
-        mock.call("pid2", Status.TERMINATED),
+        call("pid1", Status.TERMINATED),
+        call("pid2", Status.TERMINATED),
     ]
+    printer.print.assert_called_once_with("Set STATUS of pid1 to TERMINATED")
 
 
 def test_noop_pid_manager():
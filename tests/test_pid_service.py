@@ -53,6 +53,22 @@ def test_register_pid(pid_service: PidService, handle_client):
     assert result == "test/pid"
 
 
+def test_register_pid_with_status(pid_service: PidService, handle_client):
+    handle_client.register_handle.return_value = "test/pid"
+
+    with mock.patch.object(PidService, "generate_pid") as generate_pid_mock:
+        generate_pid_mock.return_value = "test/pid"
+        result = pid_service.register_pid("url", "biobank1", Status.WITHDRAWN)
+
+    handle_client.register_handle.assert_called_with(
+        handle="test/pid",
+        location="url",
+        NAME="biobank1",
+        STATUS="Withdrawn from the BBMRI-ERIC Directory",
+    )
+    assert result == "test/pid"
+
+
 def test_set_name(pid_service: PidService, handle_client):
     pid_service.set_name("pid1", "new_name")
     handle_client.modify_handle_value.assert_called_with("pid1", NAME="new_name")